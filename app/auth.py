@@ -0,0 +1,41 @@
+import hashlib
+import os
+import time
+
+import jwt
+from fastapi import Header
+
+from .cache import TTLCache
+
+SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'secret_key')
+ALGORITHM = "HS256"
+
+# Decoded payloads keyed on the token digest. Entries never outlive the
+# token's own ``exp`` claim, so an expired token is always re-decoded and
+# rejected by PyJWT.
+token_cache = TTLCache(
+    ttl=float(os.environ.get('JWT_CACHE_TTL', 300)),
+    max_size=int(os.environ.get('JWT_CACHE_SIZE', 10000))
+)
+
+def decode_token(token: str):
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    ttl = None
+    if 'exp' in payload:
+        ttl = payload['exp'] - time.time()
+    token_cache.set(key, payload, ttl)
+    return payload
+
+async def get_current_user(authorization: str = Header(None)):
+    if authorization is None:
+        return None
+    try:
+        token = authorization.replace('Bearer ', '') if authorization.startswith('Bearer ') else authorization
+        return decode_token(token)
+    except jwt.PyJWTError:
+        return None
@@ -0,0 +1,135 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from passlib.hash import bcrypt
+
+from .cache import TTLCache
+from .errors.errors import VerifierOverloaded
+from .metrics import registry
+
+
+def _verify(password: str, hashed: str) -> bool:
+    try:
+        return bcrypt.verify(password, hashed)
+    except ValueError:
+        return False
+
+
+def _timed_verify(password: str, hashed: str):
+    # Timed inside the worker so queueing is excluded; the duration travels
+    # back with the result because process workers cannot record metrics.
+    started = time.perf_counter()
+    valid = _verify(password, hashed)
+    return valid, time.perf_counter() - started
+
+
+class CredentialConfig():
+    def __init__(self):
+        self.pool_kind = os.environ.get('CREDENTIALS_POOL_KIND', 'thread')
+        self.workers = int(os.environ.get('CREDENTIALS_POOL_WORKERS', os.cpu_count() or 1))
+        self.queue_limit = int(os.environ.get('CREDENTIALS_QUEUE_LIMIT', 64))
+        self.cache_ttl = float(os.environ.get('CREDENTIALS_CACHE_TTL', 60))
+        self.cache_size = int(os.environ.get('CREDENTIALS_CACHE_SIZE', 10000))
+
+
+class VerifiedCredentialCache(TTLCache):
+    """Short-lived LRU of credentials that already passed bcrypt verification.
+
+    Entries are keyed on an HMAC of (username, password, stored hash) with a
+    per-process random key, so plaintext passwords are never kept in memory and
+    a password change invalidates the entry implicitly.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        super().__init__(ttl, max_size)
+        self._key = os.urandom(32)
+
+    def _digest(self, username: str, password: str, hashed: str) -> bytes:
+        message = '\0'.join((username, password, hashed)).encode()
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def contains(self, username: str, password: str, hashed: str) -> bool:
+        if not self.enabled:
+            return False
+        return self.get(self._digest(username, password, hashed), False)
+
+    def add(self, username: str, password: str, hashed: str):
+        if self.enabled:
+            self.set(self._digest(username, password, hashed), True)
+
+
+class CredentialVerifier():
+    """Runs bcrypt verification off the event loop on a bounded worker pool.
+
+    At most ``workers + queue_limit`` verifications may be pending at once;
+    beyond that callers get ``VerifierOverloaded`` (503) instead of queueing
+    unboundedly and dragging every other login's latency up with them.
+    """
+
+    def __init__(self, config: Optional[CredentialConfig] = None):
+        self.config = config or CredentialConfig()
+        self.cache = VerifiedCredentialCache(self.config.cache_ttl, self.config.cache_size)
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.config.workers + self.config.queue_limit
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.config.pool_kind == 'process':
+                        self._executor = ProcessPoolExecutor(max_workers=self.config.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.config.workers,
+                            thread_name_prefix='credential-verifier'
+                        )
+        return self._executor
+
+    def _acquire(self):
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise VerifierOverloaded("Credential verification queue is full")
+            self._pending += 1
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+
+    async def verify(self, username: str, password: str, hashed: Optional[str]) -> bool:
+        if not hashed:
+            return False
+        if self.cache.contains(username, password, hashed):
+            return True
+
+        self._acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            valid, seconds = await loop.run_in_executor(self._get_executor(), _timed_verify, password, hashed)
+        finally:
+            self._release()
+
+        registry.observe_bcrypt(seconds)
+        if valid:
+            self.cache.add(username, password, hashed)
+        return valid
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.cache.clear()
+
+
+credential_verifier = CredentialVerifier()
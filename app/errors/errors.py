@@ -6,4 +6,8 @@ class InvalidToken(ApiError):
     code = 401
 
 class EmptyToken(ApiError):
-    code = 403
\ No newline at end of file
+    code = 403
+
+class VerifierOverloaded(ApiError):
+    code = 503
+    description = "Credential verification is temporarily overloaded, retry later"
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import time
+
+from .session import ping, pool_saturation
+
+class HealthConfig():
+    def __init__(self):
+        self.interval = float(os.environ.get('HEALTH_CHECK_INTERVAL', 5))
+        self.timeout = float(os.environ.get('HEALTH_CHECK_TIMEOUT', 2))
+        self.lag_interval = float(os.environ.get('HEALTH_LAG_INTERVAL', 0.5))
+        self.max_loop_lag = float(os.environ.get('HEALTH_MAX_LOOP_LAG', 0.5))
+        self.max_pool_saturation = float(os.environ.get('HEALTH_MAX_POOL_SATURATION', 1.0))
+
+class HealthMonitor():
+    """Background readiness probe.
+
+    The database is pinged at most once per ``interval`` no matter how many
+    probes arrive, and event-loop lag is sampled from how late the monitor's
+    own sleeps wake up.
+    """
+
+    def __init__(self, config=None):
+        self.config = config or HealthConfig()
+        self.database_ok = None
+        self.database_error = None
+        self.checked_at = None
+        self.loop_lag = 0.0
+        self._task = None
+
+    async def check_database(self):
+        if pool_saturation() >= 1.0:
+            # Pinging would only queue behind the requests holding the pool
+            self.database_ok, self.database_error = False, "connection pool exhausted"
+        else:
+            try:
+                await asyncio.wait_for(ping(), self.config.timeout)
+                self.database_ok, self.database_error = True, None
+            except Exception as e:
+                self.database_ok, self.database_error = False, str(e) or type(e).__name__
+        self.checked_at = time.monotonic()
+
+    async def run(self):
+        while True:
+            if self.checked_at is None or time.monotonic() - self.checked_at >= self.config.interval:
+                await self.check_database()
+            expected = time.monotonic() + self.config.lag_interval
+            await asyncio.sleep(self.config.lag_interval)
+            self.loop_lag = max(0.0, time.monotonic() - expected)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.checked_at = None
+
+    async def status(self):
+        if self.checked_at is None:
+            await self.check_database()
+
+        saturation = pool_saturation()
+        reasons = []
+        if not self.database_ok:
+            reasons.append(f"database unavailable: {self.database_error}")
+        if saturation >= self.config.max_pool_saturation:
+            reasons.append("connection pool saturated")
+        if self.loop_lag > self.config.max_loop_lag:
+            reasons.append("event loop lagging")
+
+        return {
+            "status": "not ready" if reasons else "ready",
+            "reasons": reasons,
+            "database": self.database_ok,
+            "checked_seconds_ago": round(time.monotonic() - self.checked_at, 3),
+            "pool_saturation": round(saturation, 3),
+            "event_loop_lag_seconds": round(self.loop_lag, 4)
+        }
+
+health_monitor = HealthMonitor()
@@ -0,0 +1,216 @@
+"""Streaming bulk import of ``company_user_association`` rows.
+
+Rows carry ``company_id``, ``document_type`` and ``document_id`` and may be
+sent as CSV (with a header line) or NDJSON. Input is consumed line by line and
+written in chunks, each chunk in its own transaction, so memory stays bounded
+by the chunk size whatever the file size. Quoted CSV fields cannot span lines.
+
+    python -m app.importer customers.csv --company-id <uuid>
+"""
+import argparse
+import asyncio
+import codecs
+import csv
+import json
+import os
+import sys
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+
+from .models.model import Company, User, company_user_association
+from .session import SessionLocal, AsyncSessionLocal, execute, commit
+
+IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 1000))
+IMPORT_MAX_REPORTED_ERRORS = int(os.environ.get('IMPORT_MAX_REPORTED_ERRORS', 1000))
+
+async def iter_lines(chunks):
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = ''
+    line_number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield line_number + 1, pending.rstrip('\r')
+
+async def iter_records(lines, fmt):
+    """Yield ``(line_number, record, error)`` for every non-blank input line."""
+    header = None
+    async for line_number, line in lines:
+        if not line.strip():
+            continue
+        if fmt == 'ndjson':
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, None, f"invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "expected a JSON object"
+                continue
+            yield line_number, record, None
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [value.strip() for value in values]
+            missing = {'document_type', 'document_id'} - set(header)
+            if missing:
+                yield line_number, None, f"missing CSV columns: {', '.join(sorted(missing))}"
+                return
+            continue
+        if len(values) != len(header):
+            yield line_number, None, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        yield line_number, dict(zip(header, values)), None
+
+def validate_record(record, company_id: Optional[UUID]):
+    row = {}
+    for field in ('document_type', 'document_id'):
+        value = record.get(field)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{field} is required")
+        row[field] = value.strip()
+
+    raw_company_id = record.get('company_id') or None
+    if raw_company_id is None and company_id is None:
+        raise ValueError("company_id is required")
+    try:
+        row_company_id = UUID(str(raw_company_id)) if raw_company_id is not None else company_id
+    except ValueError:
+        raise ValueError("company_id is not a valid UUID")
+    if company_id is not None and row_company_id != company_id:
+        raise ValueError("company_id does not match the import target")
+    row['company_id'] = row_company_id
+    return row
+
+class AssociationImporter():
+    def __init__(self, db, company_id: Optional[UUID] = None, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.db = db
+        self.company_id = company_id
+        self.chunk_size = chunk_size
+        self.processed = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.errors = []
+
+    def report_error(self, line_number, message):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_number, "error": message})
+
+    async def run(self, records):
+        chunk = []
+        async for line_number, record, error in records:
+            self.processed += 1
+            if error:
+                self.report_error(line_number, error)
+                continue
+            try:
+                chunk.append((line_number, validate_record(record, self.company_id)))
+            except ValueError as e:
+                self.report_error(line_number, str(e))
+                continue
+            if len(chunk) >= self.chunk_size:
+                await self.flush(chunk)
+                chunk = []
+        if chunk:
+            await self.flush(chunk)
+        return self.report()
+
+    async def flush(self, chunk):
+        company_ids = {row['company_id'] for _, row in chunk}
+        known_companies = set((await execute(self.db, select(Company.id).where(
+            Company.id.in_(company_ids)
+        ))).scalars().all())
+
+        keys = {(row['company_id'], row['document_type'], row['document_id']) for _, row in chunk}
+        existing = set(tuple(key) for key in (await execute(self.db, select(
+            company_user_association.c.company_id,
+            company_user_association.c.document_type,
+            company_user_association.c.document_id
+        ).where(
+            tuple_(
+                company_user_association.c.company_id,
+                company_user_association.c.document_type,
+                company_user_association.c.document_id
+            ).in_(keys)
+        ))).all())
+
+        documents = {(row['document_type'], row['document_id']) for _, row in chunk}
+        user_ids = dict(((document_type, document_id), user_id) for user_id, document_type, document_id in (
+            await execute(self.db, select(User.id, User.document_type, User.document_id).where(
+                tuple_(User.document_type, User.document_id).in_(documents)
+            ))
+        ).all())
+
+        rows = []
+        for line_number, row in chunk:
+            key = (row['company_id'], row['document_type'], row['document_id'])
+            if row['company_id'] not in known_companies:
+                self.report_error(line_number, "company not found")
+            elif key in existing:
+                self.duplicates += 1
+            else:
+                existing.add(key)
+                row['user_id'] = user_ids.get((row['document_type'], row['document_id']))
+                rows.append(row)
+
+        if rows:
+            await execute(self.db, company_user_association.insert(), rows)
+            await commit(self.db)
+            self.inserted += len(rows)
+
+    def report(self):
+        return {
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "errors": self.errors
+        }
+
+async def _read_file(path, size=64 * 1024):
+    with open(path, 'rb') as handle:
+        while True:
+            chunk = handle.read(size)
+            if not chunk:
+                return
+            yield chunk
+
+async def _import_file(path, fmt, company_id, chunk_size):
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            importer = AssociationImporter(db, company_id, chunk_size)
+            return await importer.run(iter_records(iter_lines(_read_file(path)), fmt))
+
+    db = SessionLocal()
+    try:
+        importer = AssociationImporter(db, company_id, chunk_size)
+        return await importer.run(iter_records(iter_lines(_read_file(path)), fmt))
+    finally:
+        db.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import company/user associations from CSV or NDJSON")
+    parser.add_argument('path')
+    parser.add_argument('--format', choices=('csv', 'ndjson'))
+    parser.add_argument('--company-id', type=UUID)
+    parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ('ndjson' if args.path.endswith(('.ndjson', '.jsonl')) else 'csv')
+    report = asyncio.run(_import_file(args.path, fmt, args.company_id, args.chunk_size))
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 0 if not report['failed'] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
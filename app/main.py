@@ -1,18 +1,32 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 
 from .errors.errors import ApiError
-from .routers import company, user, manager, email
-from .session import engine
+from .routers import company, user, manager, email, health
+from .session import engine, pool_monitor
+from .credentials import credential_verifier
+from .metrics import MetricsMiddleware, registry
+from .health import health_monitor
+from .auth import token_cache
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    health_monitor.start()
+    yield
+    await health_monitor.stop()
+    credential_verifier.shutdown()
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(user.router)
 app.include_router(company.router)
 app.include_router(manager.router)
 app.include_router(email.router)
+app.include_router(health.router)
 version = "1.0"
 
 from .models.model import Base
@@ -23,6 +37,36 @@ Base.metadata.create_all(bind=engine)
 async def health():
     return {"status": "OK Python 3"}
 
+@app.get("/user/db/pool")
+async def pool_stats():
+    return pool_monitor.snapshot()
+
+@app.get("/user/metrics", response_class=PlainTextResponse)
+async def metrics():
+    pool = pool_monitor.snapshot()
+    gauges = {
+        f"db_pool_{name}": pool[name]
+        for name in ("size", "checkedin", "checkedout", "overflow")
+        if pool[name] is not None
+    }
+    counters = {
+        f"db_pool_{name}_total": pool[name]
+        for name in ("connects", "checkouts", "invalidations")
+    }
+    counters.update({
+        "jwt_cache_hits_total": token_cache.hits,
+        "jwt_cache_misses_total": token_cache.misses,
+        "credential_cache_hits_total": credential_verifier.cache.hits,
+        "credential_cache_misses_total": credential_verifier.cache.misses,
+    })
+    histograms = {
+        "db_pool_wait_seconds": ("Time spent waiting for a database session.", pool_monitor.wait_seconds)
+    }
+    return PlainTextResponse(
+        registry.render(gauges, counters, histograms),
+        media_type="text/plain; version=0.0.4"
+    )
+
 @app.exception_handler(ApiError)
 async def api_error_exception_handler(request: Request, exc: ApiError):
     return JSONResponse(
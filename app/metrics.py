@@ -0,0 +1,163 @@
+import time
+from bisect import bisect_left
+from sqlalchemy import event
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram():
+    """Fixed-bucket histogram, observations are a bisect plus two increments."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def cumulative(self):
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def snapshot(self):
+        return {
+            "buckets": {format_bound(bound): total for bound, total in self.cumulative()},
+            "count": self.count,
+            "sum": self.sum
+        }
+
+def format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+def format_labels(labels):
+    return ','.join(f'{name}="{value}"' for name, value in labels)
+
+class MetricsRegistry():
+    """In-process metrics rendered in the Prometheus text format.
+
+    Series are created on first use and kept in plain dicts keyed by label
+    values; the hot path never takes a lock. Under the GIL a concurrent
+    increment can at worst be lost, which is acceptable for monitoring.
+    """
+
+    def __init__(self):
+        self.requests = {}
+        self.request_seconds = {}
+        self.statement_seconds = {}
+        self.bcrypt_seconds = Histogram()
+
+    def observe_request(self, method, route, status, seconds):
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        histogram = self.request_seconds.get((method, route))
+        if histogram is None:
+            histogram = self.request_seconds.setdefault((method, route), Histogram())
+        histogram.observe(seconds)
+
+    def observe_statement(self, operation, seconds):
+        histogram = self.statement_seconds.get(operation)
+        if histogram is None:
+            histogram = self.statement_seconds.setdefault(operation, Histogram())
+        histogram.observe(seconds)
+
+    def observe_bcrypt(self, seconds):
+        self.bcrypt_seconds.observe(seconds)
+
+    def render(self, gauges=None, counters=None, histograms=None):
+        lines = [
+            '# HELP http_requests_total Requests by method, route template and status code.',
+            '# TYPE http_requests_total counter',
+        ]
+        for (method, route, status), count in sorted(self.requests.items()):
+            labels = format_labels((('method', method), ('route', route), ('status', status)))
+            lines.append(f'http_requests_total{{{labels}}} {count}')
+
+        self._render_histograms(
+            lines, 'http_request_duration_seconds', 'Request latency by method and route template.',
+            {(('method', method), ('route', route)): h for (method, route), h in self.request_seconds.items()}
+        )
+        self._render_histograms(
+            lines, 'db_statement_duration_seconds', 'SQL statement execution time by operation.',
+            {(('operation', operation),): h for operation, h in self.statement_seconds.items()}
+        )
+        self._render_histograms(
+            lines, 'bcrypt_verify_duration_seconds', 'Password hash verification time.',
+            {(): self.bcrypt_seconds}
+        )
+
+        for name, (help_text, histogram) in (histograms or {}).items():
+            self._render_histograms(lines, name, help_text, {(): histogram})
+
+        for kind, values in (('gauge', gauges), ('counter', counters)):
+            for name, value in (values or {}).items():
+                lines.append(f'# TYPE {name} {kind}')
+                lines.append(f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def _render_histograms(self, lines, name, help_text, series):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} histogram')
+        for labels, histogram in sorted(series.items()):
+            for bound, total in histogram.cumulative():
+                bucket_labels = format_labels(labels + (('le', format_bound(bound)),))
+                lines.append(f'{name}_bucket{{{bucket_labels}}} {total}')
+            suffix = f'{{{format_labels(labels)}}}' if labels else ''
+            lines.append(f'{name}_sum{suffix} {histogram.sum}')
+            lines.append(f'{name}_count{suffix} {histogram.count}')
+
+    def reset(self):
+        self.__init__()
+
+registry = MetricsRegistry()
+
+def instrument_engine(engine):
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_metrics_started', None)
+    if started is not None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else 'UNKNOWN'
+        registry.observe_statement(operation, time.perf_counter() - started)
+
+class MetricsMiddleware():
+    """Times every HTTP request and labels it with the matched route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            registry.observe_request(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status[0]),
+                time.perf_counter() - started
+            )
@@ -4,6 +4,8 @@ from sqlalchemy.sql import func
 from uuid import uuid4
 from sqlalchemy.dialects.postgresql import UUID
 from passlib.hash import bcrypt
+from fastapi.concurrency import run_in_threadpool
+from ..session import commit, refresh
 
 Base = declarative_base()
 
@@ -84,9 +86,10 @@ class Manager(ABCallUser):
         "polymorphic_identity": "manager",
     }
 
-def save_user(db, user_model, user_data):
-    db_user = user_model(**user_data.dict())
+async def save_user(db, user_model, user_data):
+    # Building the entity hashes the password, keep it off the event loop
+    db_user = await run_in_threadpool(user_model, **user_data.dict())
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await commit(db)
+    await refresh(db, db_user)
     return db_user
\ No newline at end of file
@@ -1,38 +1,26 @@
-from fastapi import APIRouter, Depends, Header, Path, HTTPException
+from fastapi import APIRouter, Depends, Header, Path, Query, HTTPException, Request
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select
+from typing import List, Optional
 from ..schemas.user import CompanyCreate, CompanyIdsRequest, CompanyResponse, CompanyPlanRequest
 from ..models.model import Company, ABCallUser, save_user
-from ..session import get_db
+from ..auth import get_current_user
+from ..session import get_db, execute, commit
+from ..importer import AssociationImporter, iter_lines, iter_records
 from uuid import UUID
-import jwt
-import os
 
 router = APIRouter(prefix="/user/company", tags=["Company"])
 
-SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'secret_key')
-ALGORITHM = "HS256"
-
-def get_current_user(authorization: str = Header(None)):
-    if authorization is None:
-        return None
-    try:
-        token = authorization.replace('Bearer ', '') if authorization.startswith('Bearer ') else authorization
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except jwt.PyJWTError:
-        return None
-
 @router.post("/", response_model=CompanyResponse, status_code=201)
-def create_company(company_schema: CompanyCreate, db: Session = Depends(get_db)):
-    if db.query(ABCallUser).filter(ABCallUser.username == company_schema.username).first():
+async def create_company(company_schema: CompanyCreate, db: Session = Depends(get_db)):
+    if (await execute(db, select(ABCallUser.id).where(ABCallUser.username == company_schema.username))).first():
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    created_company = save_user(db, Company, company_schema)
+    created_company = await save_user(db, Company, company_schema)
     return created_company
 
 @router.get("/{company_id}", response_model=CompanyResponse, status_code=200)
-def view_company(
+async def view_company(
     company_id: UUID = Path(..., description="Id of the company"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
@@ -46,14 +34,14 @@ def view_company(
     if current_user['user_type'] == 'company' and str(current_user['sub']) != str(company_id):
        raise HTTPException(status_code=403, detail="Not authorized to view this company")
     
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = (await execute(db, select(Company).where(Company.id == company_id))).scalars().first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     return company
 
 
 @router.post("/assign-plan", response_model=dict, status_code=200)
-def assign_plan_to_user(
+async def assign_plan_to_user(
     company_plan_info: CompanyPlanRequest,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
@@ -61,21 +49,45 @@ def assign_plan_to_user(
     if not current_user and current_user['sub'] != company_plan_info.company_id:
        raise HTTPException(status_code=401, detail="Authentication required")
     
-    company = db.query(Company).filter(
+    company = (await execute(db, select(Company).where(
         Company.id == company_plan_info.company_id,
-    ).first()
+    ))).scalars().first()
 
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
     company.plan_id = company_plan_info.plan_id
-    db.commit()
+    await commit(db)
 
     return {"message": "Plan assigned successfully"}
 
 
+@router.post("/{company_id}/associations/import", response_model=dict, status_code=200)
+async def import_associations(
+    request: Request,
+    company_id: UUID = Path(..., description="Id of the company"),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not current_user:
+       raise HTTPException(status_code=401, detail="Authentication required")
+
+    if current_user['user_type'] not in ['manager', 'company']:
+       raise HTTPException(status_code=403, detail="Not authorized to import users")
+
+    if current_user['user_type'] == 'company' and str(current_user['sub']) != str(company_id):
+       raise HTTPException(status_code=403, detail="Not authorized to import users for this company")
+
+    if format is None:
+        content_type = request.headers.get('content-type', '')
+        format = 'ndjson' if 'ndjson' in content_type or 'jsonl' in content_type else 'csv'
+
+    importer = AssociationImporter(db, company_id)
+    return await importer.run(iter_records(iter_lines(request.stream()), format))
+
 @router.post("/get-by-id", response_model=List[dict], status_code=200)
-def get_companies(
+async def get_companies(
     company_ids_request: CompanyIdsRequest,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
@@ -100,7 +112,7 @@ def get_companies(
             detail="Invalid UUID format in company_ids"
         )
     
-    companies = db.query(Company).filter(Company.id.in_(company_ids)).all()
+    companies = (await execute(db, select(Company).where(Company.id.in_(company_ids)))).scalars().all()
     
     if not companies:
         raise HTTPException(status_code=404, detail="No companies found")
@@ -1,9 +1,9 @@
 # app/routers/email.py
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 from ..models.model import User, Company, ABCallUser, company_user_association
-from ..session import get_db
+from ..session import get_db, execute
 from pydantic import BaseModel
 import logging
 from typing import Optional
@@ -26,15 +26,15 @@ class UserValidationResponse(BaseModel):
     company_name: str
 
 @router.get("/company", response_model=CompanySearchResponse)
-def search_company_by_name(
+async def search_company_by_name(
     name: str,
     db: Session = Depends(get_db)
 ):
     """Search company by name"""
     try:
-        company = db.query(Company).filter(
+        company = (await execute(db, select(Company).where(
             func.lower(Company.name) == func.lower(name)
-        ).first()
+        ))).scalars().first()
         
         if not company:
             raise HTTPException(
@@ -54,25 +54,25 @@ def search_company_by_name(
         )
 
 @router.get("/validate", response_model=UserValidationResponse)
-def validate_user_company(
+async def validate_user_company(
     email: str,
     company_id: UUID,
     db: Session = Depends(get_db)
 ):
     """Validate user email belongs to company"""
     # First find the user by email
-    user = db.query(User).filter(User.username == email).first()
+    user = (await execute(db, select(User).where(User.username == email))).scalars().first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     # Then check if this user is associated with the specified company
-    company = db.query(Company).join(
+    company = (await execute(db, select(Company).join(
         company_user_association,
         and_(
             company_user_association.c.company_id == company_id,
             company_user_association.c.user_id == user.id
         )
-    ).first()
+    ))).scalars().first()
 
     if not company:
         raise HTTPException(status_code=404, detail="User does not belong to this company")
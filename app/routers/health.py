@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from ..health import health_monitor
+
+router = APIRouter(prefix="/user/health", tags=["Health"])
+
+@router.get("/live")
+async def liveness():
+    return {"status": "alive"}
+
+@router.get("/ready")
+async def readiness():
+    status = await health_monitor.status()
+    return JSONResponse(status_code=200 if status["status"] == "ready" else 503, content=status)
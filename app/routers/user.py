@@ -1,60 +1,54 @@
 # app/routers/user.py
 from fastapi import APIRouter, Depends, Header, Query, Path, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from ..schemas.user import UserCreate, UserResponse, UserDocumentInfo, UserCompaniesResponse, UserIdRequest
-from ..schemas.user import UserCredentials, UserValidationResponse
+from ..schemas.user import UserCredentials, UserValidationResponse, UserIdsRequest, UserBatchResponse
 from ..models.model import User, Company, ABCallUser, company_user_association
-from ..session import get_db
+from ..auth import get_current_user
+from ..session import get_db, execute, commit, refresh
+from ..credentials import credential_verifier
 from uuid import UUID
-from passlib.hash import bcrypt
-import jwt
 import os
 
 router = APIRouter(prefix="/user/user", tags=["User"])
 
-SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'secret_key')
-ALGORITHM = "HS256"
+MAX_BATCH_USER_IDS = int(os.environ.get('USER_BATCH_MAX_IDS', 100))
 
-def get_current_user(authorization: str = Header(None)):
-    if authorization is None:
-        return None
-    try:
-        token = authorization.replace('Bearer ', '') if authorization.startswith('Bearer ') else authorization
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except jwt.PyJWTError:
-        return None
+def update_user_fields(user, fields):
+    for key, value in fields.items():
+        setattr(user, key, value)
 
 @router.post("/", response_model=UserResponse, status_code=201)
-def create_user(user_schema: UserCreate, db: Session = Depends(get_db)):
-    association = db.query(company_user_association).filter(
+async def create_user(user_schema: UserCreate, db: Session = Depends(get_db)):
+    association = (await execute(db, select(company_user_association).where(
         company_user_association.c.document_type == user_schema.document_type,
         company_user_association.c.document_id == user_schema.document_id
-    ).first()
+    ))).first()
 
     if not association:
         raise HTTPException(status_code=400, detail="The given user does not belong to any registered company")
 
-    if db.query(ABCallUser).filter(ABCallUser.username == user_schema.username).first():
+    if (await execute(db, select(ABCallUser.id).where(ABCallUser.username == user_schema.username))).first():
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    existing_user = db.query(User).filter(
+    existing_user = (await execute(db, select(User).where(
         User.document_type == user_schema.document_type,
         User.document_id == user_schema.document_id
-    ).first()
+    ))).scalars().first()
 
     if existing_user:
-        for key, value in user_schema.dict().items():
-            setattr(existing_user, key, value)
-        db.commit()
-        db.refresh(existing_user)
+        # Assigning the password hashes it, keep it off the event loop
+        await run_in_threadpool(update_user_fields, existing_user, user_schema.dict())
+        await commit(db)
+        await refresh(db, existing_user)
         return existing_user
     else:
         raise HTTPException(status_code=404, detail="User to update not found")
 
 @router.get("/{user_id}", response_model=UserResponse, status_code=200)
-def view_user(
+async def view_user(
     user_id: UUID = Path(..., description="Id of the user"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
@@ -65,23 +59,70 @@ def view_user(
     if current_user['user_type'] not in ['manager', 'company']:
        raise HTTPException(status_code=403, detail="Not authorized to view users")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await execute(db, select(User).where(User.id == user_id))).scalars().first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     if current_user['user_type'] == 'company':
 
-        association = db.query(company_user_association).filter(
-            company_user_association.c.company_id == current_user['sub'],
+        association = (await execute(db, select(company_user_association).where(
+            company_user_association.c.company_id == UUID(current_user['sub']),
             company_user_association.c.user_id == user_id
-        ).first()
+        ))).first()
         if not association:
             raise HTTPException(status_code=403, detail="Not authorized to view this user")
 
     return user
 
+@router.post("/get-by-id", response_model=UserBatchResponse, status_code=200)
+async def view_users(
+    user_ids_request: UserIdsRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    if not current_user:
+       raise HTTPException(status_code=401, detail="Authentication required")
+
+    if current_user['user_type'] not in ['manager', 'company']:
+       raise HTTPException(status_code=403, detail="Not authorized to view users")
+
+    user_ids = user_ids_request.user_ids
+    if not user_ids:
+        raise HTTPException(status_code=400, detail="At least one user ID must be provided")
+    if len(user_ids) > MAX_BATCH_USER_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_USER_IDS} user IDs can be requested at once"
+        )
+
+    unique_ids = set(user_ids)
+    users = (await execute(db, select(User).where(User.id.in_(unique_ids)))).scalars().all()
+    user_map = {user.id: user for user in users}
+
+    allowed_ids = unique_ids
+    if current_user['user_type'] == 'company':
+        allowed_ids = set((await execute(db, select(company_user_association.c.user_id).where(
+            company_user_association.c.company_id == UUID(current_user['sub']),
+            company_user_association.c.user_id.in_(unique_ids)
+        ))).scalars().all())
+
+    results = []
+    for user_id in user_ids:
+        user = user_map.get(user_id)
+        if user is None:
+            results.append({"user_id": user_id, "status": "not_found"})
+        elif user_id not in allowed_ids:
+            results.append({"user_id": user_id, "status": "forbidden"})
+        elif user.username is None:
+            # Pre-provisioned by a company but never registered
+            results.append({"user_id": user_id, "status": "unregistered"})
+        else:
+            results.append({"user_id": user_id, "status": "found", "user": user})
+
+    return UserBatchResponse(results=results)
+
 @router.post("/companies", response_model=UserCompaniesResponse)
-def get_user_companies(
+async def get_user_companies(
     user_doc_info: UserDocumentInfo,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
@@ -89,10 +130,10 @@ def get_user_companies(
     if not current_user:
        raise HTTPException(status_code=401, detail="Authentication required")
     
-    user = db.query(User).filter(
+    user = (await execute(db, select(User).where(
         User.document_type == user_doc_info.document_type,
         User.document_id == user_doc_info.document_id
-    ).first()
+    ))).scalars().first()
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -103,18 +144,18 @@ def get_user_companies(
     elif current_user['user_type'] == 'company':
         raise HTTPException(status_code=403, detail="Not authorized to view user companies")
 
-    companies = db.query(Company).join(
+    companies = (await execute(db, select(Company).join(
         company_user_association,
         and_(
             company_user_association.c.company_id == Company.id,
             company_user_association.c.user_id == user.id
         )
-    ).all()
+    ))).scalars().all()
 
     return UserCompaniesResponse(user_id=user.id, companies=companies)
 
 @router.post("/companies-user", response_model=UserCompaniesResponse)
-def get_user_companies(
+async def get_user_companies(
     user_doc_info: UserIdRequest,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
@@ -122,9 +163,9 @@ def get_user_companies(
     if not current_user:
        raise HTTPException(status_code=401, detail="Authentication required")
     
-    user = db.query(User).filter(
+    user = (await execute(db, select(User).where(
         User.id == user_doc_info.id,
-    ).first()
+    ))).scalars().first()
 
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -135,13 +176,13 @@ def get_user_companies(
     elif current_user['user_type'] == 'company':
        raise HTTPException(status_code=403, detail="Not authorized to view user companies")
 
-    companies = db.query(Company).join(
+    companies = (await execute(db, select(Company).join(
         company_user_association,
         and_(
             company_user_association.c.company_id == Company.id,
             company_user_association.c.user_id == user.id
         )
-    ).all()
+    ))).scalars().all()
 
     return UserCompaniesResponse(user_id=user.id, companies=companies)
 
@@ -150,14 +191,14 @@ async def validate_credentials(
     credentials: UserCredentials,
     db: Session = Depends(get_db)
 ):
-    user = db.query(ABCallUser).filter(
+    user = (await execute(db, select(ABCallUser).where(
         ABCallUser.username == credentials.username
-    ).first()
+    ))).scalars().first()
     
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not bcrypt.verify(credentials.password, user.password):
+    if not await credential_verifier.verify(credentials.username, credentials.password, user.password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     user_type = user.type
@@ -124,6 +124,17 @@ class UserCompaniesResponse(BaseModel):
     
 class UserIdRequest(BaseModel):
     id: UUID
+
+class UserIdsRequest(BaseModel):
+    user_ids: List[UUID]
+
+class UserBatchItem(BaseModel):
+    user_id: UUID
+    status: str
+    user: Optional[UserResponse] = None
+
+class UserBatchResponse(BaseModel):
+    results: List[UserBatchItem]
     
 class UserCredentials(BaseModel):
     username: EmailStr
@@ -1,10 +1,32 @@
+import asyncio
 import os
-from sqlalchemy import create_engine
+import time
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from .metrics import Histogram, instrument_engine
+
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+def env_flag(name, default):
+    return os.environ.get(name, default).lower() in ('1', 'true', 'yes')
 
 class SessionConfig():
     def __init__(self):
-        ...
+        self.async_mode = env_flag('DB_ASYNC', 'false')
+        self.pool_size = int(os.environ.get('DB_POOL_SIZE', 5))
+        self.max_overflow = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+        self.pool_timeout = float(os.environ.get('DB_POOL_TIMEOUT', 30))
+        self.pool_recycle = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+        self.pool_pre_ping = env_flag('DB_POOL_PRE_PING', 'true')
+        self.pool_use_lifo = env_flag('DB_POOL_LIFO', 'false')
+        self.statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+        self.application_name = os.environ.get('DB_APPLICATION_NAME', 'user-service')
+        self.max_sessions = int(os.environ.get('DB_MAX_SESSIONS', self.pool_size + self.max_overflow))
 
     def url(self):
         try:
@@ -18,13 +40,152 @@ class SessionConfig():
             print(f'No database environment variables found, using SQLite as fallback ({k})')
             return 'sqlite:///./test.db'
 
+    def async_url(self, url):
+        scheme, rest = url.split('://', 1)
+        return f'{ASYNC_DRIVERS[scheme]}://{rest}'
+
+    def connect_args(self, url):
+        if url.startswith('sqlite'):
+            return {"check_same_thread": False}
+        if url.startswith('postgresql+asyncpg'):
+            settings = {"application_name": self.application_name}
+            if self.statement_timeout:
+                settings["statement_timeout"] = str(self.statement_timeout)
+            return {"server_settings": settings}
+
+        args = {"application_name": self.application_name}
+        if self.statement_timeout:
+            args["options"] = f'-c statement_timeout={self.statement_timeout}'
+        return args
+
+    def engine_options(self, url):
+        return {
+            "connect_args": self.connect_args(url),
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_use_lifo": self.pool_use_lifo,
+        }
+
+class PoolMonitor():
+    """Live pool statistics for sizing pools per replica."""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.wait_seconds = Histogram()
+        self.pool = None
+
+    def attach(self, engine):
+        self.pool = engine.pool
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.invalidations += 1
+
+    def snapshot(self):
+        stats = {}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(self.pool, name, None)
+            stats[name] = method() if method else None
+        stats.update({
+            "max_sessions": session_config.max_sessions,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+            "wait_seconds": self.wait_seconds.snapshot()
+        })
+        return stats
+
 session_config = SessionConfig()
-engine = create_engine(session_config.url())
+database_url = session_config.url()
+engine = create_engine(database_url, **session_config.engine_options(database_url))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+pool_monitor = PoolMonitor()
+instrument_engine(engine)
+
+async_engine = None
+AsyncSessionLocal = None
+if session_config.async_mode:
+    async_url = session_config.async_url(database_url)
+    async_engine = create_async_engine(async_url, **session_config.engine_options(async_url))
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    pool_monitor.attach(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine)
+else:
+    pool_monitor.attach(engine)
+
+_session_slots = None
+
+def session_slots():
+    # Blocking sessions hop to the threadpool once per statement. Waiting for
+    # a pooled connection inside a worker thread could starve the threads the
+    # current holders need to finish, so callers queue here on the event loop
+    # until a connection is guaranteed to be available. Async sessions queue
+    # here too so pool waits are measured in one place.
+    global _session_slots
+    if _session_slots is None:
+        _session_slots = asyncio.Semaphore(session_config.max_sessions)
+    return _session_slots
+
+async def get_db():
+    slots = session_slots()
+    started = time.perf_counter()
+    async with slots:
+        pool_monitor.wait_seconds.observe(time.perf_counter() - started)
+        if AsyncSessionLocal is not None:
+            async with AsyncSessionLocal() as db:
+                yield db
+            return
+
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
+
+# The helpers below let handlers await their queries regardless of the
+# session flavour: AsyncSession calls are awaited natively, blocking Session
+# calls are pushed to the threadpool so they never stall the event loop.
+
+async def execute(db, statement, params=None):
+    if isinstance(db, AsyncSession):
+        return await db.execute(statement, params)
+    return await run_in_threadpool(db.execute, statement, params)
+
+async def commit(db):
+    if isinstance(db, AsyncSession):
+        return await db.commit()
+    return await run_in_threadpool(db.commit)
+
+async def refresh(db, instance):
+    if isinstance(db, AsyncSession):
+        return await db.refresh(instance)
+    return await run_in_threadpool(db.refresh, instance)
+
+def pool_saturation():
+    checked_out = pool_monitor.snapshot()["checkedout"] or 0
+    capacity = session_config.pool_size + session_config.max_overflow
+    return checked_out / capacity if capacity else 0.0
+
+async def ping():
+    if async_engine is not None:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+    def _ping():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    await run_in_threadpool(_ping)
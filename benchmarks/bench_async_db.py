@@ -0,0 +1,124 @@
+"""Compare requests/sec of the blocking and async database modes.
+
+Starts the service twice with uvicorn (``DB_ASYNC=false`` then ``DB_ASYNC=true``)
+against the same database and drives ``GET /user/email/validate`` at a fixed
+concurrency. Uses the SQLite fallback unless the usual ``DB_*`` variables point
+at Postgres.
+
+    python benchmarks/bench_async_db.py --requests 2000 --concurrency 100
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from datetime import date
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.model import Base, Company, User, company_user_association  # noqa: E402
+from app.session import SessionConfig  # noqa: E402
+
+PORT = 8102
+
+
+def seed(url):
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        company = Company(
+            username="bench-company@example.com", password="$2b$placeholder",
+            first_name="Bench", last_name="Company", name="Bench Company",
+            birth_date=date(1990, 1, 1), phone_number="1", country="CO", city="Bogota"
+        )
+        user = User(
+            username="bench-user@example.com", first_name="Bench", last_name="User",
+            document_type="passport", document_id="BENCH1"
+        )
+        db.add_all([company, user])
+        db.flush()
+        db.execute(company_user_association.insert().values(
+            company_id=company.id, user_id=user.id,
+            document_type=user.document_type, document_id=user.document_id
+        ))
+        db.commit()
+        params = {"email": user.username, "company_id": str(company.id)}
+    engine.dispose()
+    return params
+
+
+async def drive(params, total, concurrency):
+    latencies = []
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker(client):
+        while not queue.empty():
+            queue.get_nowait()
+            started = time.perf_counter()
+            response = await client.get("/user/email/validate", params=params)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def wait_until_ready(timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{PORT}/user/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("service did not start")
+
+
+def run_mode(async_mode, params, args):
+    env = dict(os.environ, DB_ASYNC="true" if async_mode else "false")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--log-level", "warning"],
+        env=env
+    )
+    try:
+        wait_until_ready()
+        asyncio.run(drive(params, min(args.requests, 100), args.concurrency))
+        return asyncio.run(drive(params, args.requests, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    params = seed(SessionConfig().url())
+    for label, async_mode in (("sync", False), ("async", True)):
+        result = run_mode(async_mode, params, args)
+        print(f"{label:>5}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
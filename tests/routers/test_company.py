@@ -5,7 +5,7 @@ import jwt
 import os
 from datetime import date
 
-from app.models.model import Company
+from app.models.model import Company, company_user_association
 
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'secret_key')
 ALGORITHM = "HS256"
@@ -219,4 +219,64 @@ def test_get_companies_invalid_ids(client):
     
     response = client.post("/user/company/get-by-id", json={"company_ids": [str(invalid_id1), str(invalid_id2)]}, headers={"authorization": create_token(uuid4(), "manager")})
     assert response.status_code == 404
-    assert response.json()["detail"] == "No companies found"
\ No newline at end of file
+    assert response.json()["detail"] == "No companies found"
+def test_import_associations_csv(client, db_session):
+    company = create_company(db_session, username="importer@example.com")
+    token = create_token(company.id, "company")
+    body = (
+        "document_type,document_id\n"
+        "passport,IM000001\n"
+        "passport,IM000002\n"
+        "passport,IM000001\n"
+        ",IM000003\n"
+    )
+
+    response = client.post(
+        f"/user/company/{company.id}/associations/import",
+        content=body.encode(),
+        headers={"authorization": token, "content-type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["processed"] == 4
+    assert report["inserted"] == 2
+    assert report["duplicates"] == 1
+    assert report["errors"] == [{"line": 5, "error": "document_type is required"}]
+
+    rows = db_session.execute(
+        company_user_association.select().where(company_user_association.c.company_id == company.id)
+    ).all()
+    assert sorted(row.document_id for row in rows) == ["IM000001", "IM000002"]
+
+def test_import_associations_ndjson_in_chunks(client, db_session, mocker):
+    company = create_company(db_session, username="ndjson@example.com")
+    token = create_token(uuid4(), "manager")
+    mocker.patch("app.importer.IMPORT_CHUNK_SIZE", 2)
+    lines = [f'{{"document_type": "cc", "document_id": "ND{i:06d}"}}' for i in range(5)]
+    lines.append(f'{{"company_id": "{uuid4()}", "document_type": "cc", "document_id": "OTHER"}}')
+    lines.append('not json')
+
+    response = client.post(
+        f"/user/company/{company.id}/associations/import?format=ndjson",
+        content="\n".join(lines).encode(),
+        headers={"authorization": token}
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 5
+    assert report["failed"] == 2
+    assert report["errors"][0] == {"line": 6, "error": "company_id does not match the import target"}
+
+def test_import_associations_other_company_forbidden(client, db_session):
+    company = create_company(db_session, username="target@example.com")
+    token = create_token(uuid4(), "company")
+
+    response = client.post(
+        f"/user/company/{company.id}/associations/import",
+        content=b"document_type,document_id\npassport,X1\n",
+        headers={"authorization": token}
+    )
+
+    assert response.status_code == 403
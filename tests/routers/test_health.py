@@ -0,0 +1,43 @@
+from app.health import health_monitor
+
+def test_liveness(client):
+    response = client.get("/user/health/live")
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+
+def test_readiness(client):
+    response = client.get("/user/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["database"] is True
+    assert data["reasons"] == []
+
+def test_readiness_uses_cached_check(client, mocker):
+    client.get("/user/health/ready")
+    ping = mocker.patch("app.health.ping")
+
+    client.get("/user/health/ready")
+    client.get("/user/health/ready")
+
+    ping.assert_not_called()
+
+def test_readiness_database_down(client, mocker):
+    mocker.patch("app.health.ping", side_effect=ConnectionError("connection refused"))
+    client.portal.call(health_monitor.stop)
+    client.portal.call(health_monitor.check_database)
+
+    response = client.get("/user/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reasons"] == ["database unavailable: connection refused"]
+
+def test_readiness_pool_exhausted(client, mocker):
+    mocker.patch("app.health.pool_saturation", return_value=1.0)
+    client.portal.call(health_monitor.stop)
+    client.portal.call(health_monitor.check_database)
+
+    response = client.get("/user/health/ready")
+
+    assert response.status_code == 503
+    assert "connection pool saturated" in response.json()["reasons"]
@@ -8,6 +8,8 @@ from passlib.hash import bcrypt
 
 from app.models.model import User, Company, company_user_association, Manager
 from app.schemas.user import UserDocumentInfo
+from app import credentials as credentials_module
+from app.credentials import credential_verifier
 
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'secret_key')
 ALGORITHM = "HS256"
@@ -232,4 +234,128 @@ def test_validate_credentials_invalid_password(client, db_session):
     response = client.post("/user/user/validate-credentials", json=credentials)
     
     assert response.status_code == 401
-    assert response.json()["detail"] == "Invalid credentials"
\ No newline at end of file
+    assert response.json()["detail"] == "Invalid credentials"
+def create_user_with_credentials(db_session, username, password):
+    user = User(
+        username=username,
+        password=password,
+        first_name="Valid",
+        last_name="User",
+        document_type="passport",
+        document_id="CR123456"
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+def test_validate_credentials_success(client, db_session):
+    user = create_user_with_credentials(db_session, "login@example.com", "validpassword")
+
+    credentials = {
+        "username": "login@example.com",
+        "password": "validpassword"
+    }
+
+    response = client.post("/user/user/validate-credentials", json=credentials)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == str(user.id)
+    assert data["user_type"] == "user"
+
+def test_validate_credentials_uses_verified_cache(client, db_session, mocker):
+    create_user_with_credentials(db_session, "cached@example.com", "validpassword")
+    credentials = {
+        "username": "cached@example.com",
+        "password": "validpassword"
+    }
+
+    verify_spy = mocker.spy(credentials_module, "_verify")
+    first = client.post("/user/user/validate-credentials", json=credentials)
+    second = client.post("/user/user/validate-credentials", json=credentials)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert verify_spy.call_count == 1
+
+def test_validate_credentials_overloaded(client, db_session, mocker):
+    create_user_with_credentials(db_session, "busy@example.com", "validpassword")
+    mocker.patch.object(credential_verifier, "_pending", credential_verifier.capacity)
+
+    credentials = {
+        "username": "busy@example.com",
+        "password": "validpassword"
+    }
+
+    response = client.post("/user/user/validate-credentials", json=credentials)
+
+    assert response.status_code == 503
+
+def create_registered_user(db_session, username, document_id):
+    user = User(
+        username=username,
+        password="hashed_password",
+        first_name="Batch",
+        last_name="User",
+        document_type="passport",
+        document_id=document_id,
+        birth_date=date(1990, 1, 1),
+        phone_number="5550001111",
+        importance=5
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+def test_view_users_batch_as_manager(client, db_session):
+    user_1 = create_registered_user(db_session, "batch1@example.com", "BA000001")
+    user_2 = create_registered_user(db_session, "batch2@example.com", "BA000002")
+    missing_id = uuid4()
+    token = create_token(uuid4(), "manager")
+
+    response = client.post(
+        "/user/user/get-by-id",
+        json={"user_ids": [str(user_2.id), str(missing_id), str(user_1.id)]},
+        headers={"authorization": token}
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["user_id"] for item in results] == [str(user_2.id), str(missing_id), str(user_1.id)]
+    assert [item["status"] for item in results] == ["found", "not_found", "found"]
+    assert results[0]["user"]["username"] == "batch2@example.com"
+    assert results[1]["user"] is None
+
+def test_view_users_batch_as_company(client, db_session):
+    company = create_company(db_session, username="batchcompany@example.com")
+    own_user = create_registered_user(db_session, "own@example.com", "BA000003")
+    other_user = create_registered_user(db_session, "other@example.com", "BA000004")
+    associate_user_company(db_session, own_user.id, company.id, own_user.document_type, own_user.document_id)
+    token = create_token(company.id, "company")
+
+    response = client.post(
+        "/user/user/get-by-id",
+        json={"user_ids": [str(own_user.id), str(other_user.id)]},
+        headers={"authorization": token}
+    )
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["results"]] == ["found", "forbidden"]
+
+def test_view_users_batch_limits(client, db_session):
+    token = create_token(uuid4(), "manager")
+
+    empty = client.post("/user/user/get-by-id", json={"user_ids": []}, headers={"authorization": token})
+    assert empty.status_code == 400
+
+    too_many = client.post(
+        "/user/user/get-by-id",
+        json={"user_ids": [str(uuid4()) for _ in range(101)]},
+        headers={"authorization": token}
+    )
+    assert too_many.status_code == 400
+
+def test_view_users_batch_forbidden_for_users(client, db_session):
+    token = create_token(uuid4(), "user")
+    response = client.post("/user/user/get-by-id", json={"user_ids": [str(uuid4())]}, headers={"authorization": token})
+    assert response.status_code == 403
@@ -0,0 +1,43 @@
+import time
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from app import auth
+from app.auth import ALGORITHM, SECRET_KEY, decode_token, token_cache
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+def test_decode_token_is_cached(mocker):
+    token = jwt.encode({"sub": str(uuid4()), "user_type": "manager"}, SECRET_KEY, algorithm=ALGORITHM)
+    decode_spy = mocker.spy(auth.jwt, "decode")
+    hits = token_cache.hits
+
+    first = decode_token(token)
+    second = decode_token(token)
+
+    assert first == second
+    assert decode_spy.call_count == 1
+    assert token_cache.hits == hits + 1
+
+def test_cached_token_respects_exp():
+    token = jwt.encode({"sub": str(uuid4()), "exp": int(time.time()) + 1}, SECRET_KEY, algorithm=ALGORITHM)
+    decode_token(token)
+
+    time.sleep(1.1)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_token(token)
+
+def test_current_user_shared_across_routers(client):
+    manager_token = jwt.encode({"sub": str(uuid4()), "user_type": "manager"}, SECRET_KEY, algorithm=ALGORITHM)
+    headers = {"authorization": f"Bearer {manager_token}"}
+
+    assert client.get(f"/user/manager/{uuid4()}", headers=headers).status_code == 404
+    assert client.get(f"/user/company/{uuid4()}", headers=headers).status_code == 404
+    assert len(token_cache) == 1
@@ -0,0 +1,35 @@
+from uuid import uuid4
+
+from app.metrics import Histogram, MetricsRegistry, registry
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 1), (1.0, 3), (float('inf'), 4)]
+    assert histogram.count == 4
+
+def test_render_prometheus_text():
+    metrics = MetricsRegistry()
+    metrics.observe_request("GET", "/user/user/{user_id}", "200", 0.02)
+    metrics.observe_statement("SELECT", 0.001)
+
+    text = metrics.render(gauges={"db_pool_checkedout": 2})
+
+    assert 'http_requests_total{method="GET",route="/user/user/{user_id}",status="200"} 1' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/user/user/{user_id}",le="0.025"} 1' in text
+    assert 'db_statement_duration_seconds_count{operation="SELECT"} 1' in text
+    assert 'db_pool_checkedout 2' in text
+
+def test_metrics_endpoint_uses_route_templates(client):
+    registry.reset()
+    client.get(f"/user/user/{uuid4()}")
+    client.get(f"/user/user/{uuid4()}")
+
+    response = client.get("/user/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_requests_total{method="GET",route="/user/user/{user_id}",status="401"} 2' in response.text
+    assert "db_pool_size" in response.text
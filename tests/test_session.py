@@ -0,0 +1,98 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+import jwt
+import os
+
+from app.main import app
+from app.models.model import Base
+from app.session import SessionConfig, get_db
+
+SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'secret_key')
+ALGORITHM = "HS256"
+
+@pytest.fixture(scope="function")
+def async_client(tmp_path):
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", poolclass=NullPool)
+    AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_db():
+        async with AsyncTestingSessionLocal() as db:
+            yield db
+
+    async def create_schema():
+        async with async_engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        test_client.portal.call(create_schema)
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+    app.dependency_overrides.clear()
+
+def test_async_url_maps_drivers():
+    config = SessionConfig()
+    assert config.async_url('postgresql://u:p@db:5432/users') == 'postgresql+asyncpg://u:p@db:5432/users'
+    assert config.async_url('sqlite:///./test.db') == 'sqlite+aiosqlite:///./test.db'
+
+def test_async_mode_from_env(monkeypatch):
+    monkeypatch.setenv('DB_ASYNC', 'true')
+    assert SessionConfig().async_mode is True
+    monkeypatch.delenv('DB_ASYNC')
+    assert SessionConfig().async_mode is False
+
+def test_handlers_run_on_async_session(async_client):
+    manager_data = {
+        "username": "asyncmanager@example.com",
+        "password": "testpassword",
+        "first_name": "Async",
+        "last_name": "Manager"
+    }
+
+    created = async_client.post("/user/manager/", json=manager_data)
+    assert created.status_code == 201
+    manager_id = created.json()["id"]
+
+    token = jwt.encode({"sub": manager_id, "user_type": "manager"}, SECRET_KEY, algorithm=ALGORITHM)
+    fetched = async_client.get(f"/user/manager/{manager_id}", headers={"authorization": f"Bearer {token}"})
+    assert fetched.status_code == 200
+    assert fetched.json()["username"] == manager_data["username"]
+
+    credentials = {"username": manager_data["username"], "password": manager_data["password"]}
+    validated = async_client.post("/user/user/validate-credentials", json=credentials)
+    assert validated.status_code == 200
+    assert validated.json()["user_type"] == "manager"
+
+def test_engine_options_from_env(monkeypatch):
+    monkeypatch.setenv('DB_POOL_SIZE', '20')
+    monkeypatch.setenv('DB_MAX_OVERFLOW', '5')
+    monkeypatch.setenv('DB_POOL_LIFO', 'true')
+    monkeypatch.setenv('DB_STATEMENT_TIMEOUT_MS', '5000')
+    monkeypatch.setenv('DB_APPLICATION_NAME', 'user-service-test')
+    config = SessionConfig()
+
+    options = config.engine_options('postgresql://u:p@db:5432/users')
+    assert options['pool_size'] == 20
+    assert options['max_overflow'] == 5
+    assert options['pool_use_lifo'] is True
+    assert options['connect_args'] == {
+        "application_name": "user-service-test",
+        "options": "-c statement_timeout=5000"
+    }
+    assert config.max_sessions == 25
+
+    async_options = config.engine_options('postgresql+asyncpg://u:p@db:5432/users')
+    assert async_options['connect_args'] == {
+        "server_settings": {"application_name": "user-service-test", "statement_timeout": "5000"}
+    }
+
+def test_pool_stats(client):
+    response = client.get("/user/db/pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["size"] == 5
+    assert "checkedout" in data
+    assert "+Inf" in data["wait_seconds"]["buckets"]